@@ -4,8 +4,10 @@ TOP_CITIES_TO_TAKE = 10
 CITIES_URL = "https://simplemaps.com/static/data/country-cities/in/in.json"
 WEATHER_URL = "https://api.openweathermap.org/data/3.0/onecall/day_summary"
 
-# S3 paths
+# Storage paths
+# The storage backend can be overridden with the "STORAGE_URI" env var, e.g. "file:///data/etl"
 S3_BUCKET_NAME = "indian-cities-weather-etl"
+DEFAULT_STORAGE_URI = f"s3://{S3_BUCKET_NAME}"
 S3_RAW_PREFIX = "raw"
 S3_REFINED_PREFIX = "refined"
 
@@ -0,0 +1,137 @@
+import os
+from urllib.parse import urlparse
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class S3Storage:
+    """
+    Storage backend which keeps the raw and refined layers in an S3 bucket
+    """
+
+    def __init__(self, s3_client, bucket, root=""):
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.root = root.strip("/")
+        self.uri = f"s3://{bucket}/{self.root}".rstrip("/")
+
+    def _key(self, path):
+        return f"{self.root}/{path}" if self.root else path
+
+    def put(self, path, data):
+        self.s3_client.put_object(Bucket=self.bucket, Key=self._key(path), Body=data)
+
+    def get(self, path):
+        obj = self.s3_client.get_object(Bucket=self.bucket, Key=self._key(path))
+        return obj["Body"].read()
+
+    def get_range(self, path, start, length):
+        obj = self.s3_client.get_object(
+            Bucket=self.bucket,
+            Key=self._key(path),
+            Range=f"bytes={start}-{start + length - 1}",
+        )
+        return obj["Body"].read()
+
+    def stream(self, path, chunk_size=DEFAULT_CHUNK_SIZE):
+        obj = self.s3_client.get_object(Bucket=self.bucket, Key=self._key(path))
+        yield from obj["Body"].iter_chunks(chunk_size)
+
+    def list(self, prefix):
+        """
+        List the paths under the passed prefix (relative to the storage root)
+        """
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        strip = len(self.root) + 1 if self.root else 0
+
+        paths = []
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self._key(prefix)):
+            for obj in page.get("Contents", []):
+                paths.append(obj["Key"][strip:])
+        return paths
+
+    def read_table(self, path):
+        return pq.read_table(pa.BufferReader(self.get(path)))
+
+
+class LocalStorage:
+    """
+    Storage backend which keeps the raw and refined layers on the local filesystem.
+    Parquet files are memory-mapped, so Arrow reads them without copying into the heap.
+    """
+
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+        self.uri = f"file://{self.root}"
+
+    def _path(self, path):
+        return os.path.join(self.root, *path.split("/"))
+
+    def put(self, path, data):
+        full_path = self._path(path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
+        # Write to a temporary file first so readers never see a partial object
+        tmp_path = f"{full_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, full_path)
+
+    def get(self, path):
+        with open(self._path(path), "rb") as f:
+            return f.read()
+
+    def get_range(self, path, start, length):
+        with open(self._path(path), "rb") as f:
+            f.seek(start)
+            return f.read(length)
+
+    def stream(self, path, chunk_size=DEFAULT_CHUNK_SIZE):
+        with open(self._path(path), "rb") as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+
+    def list(self, prefix):
+        """
+        List the paths under the passed prefix (relative to the storage root)
+        """
+        # Only walk the deepest directory the prefix fully names
+        walk_dir = self._path(prefix.rsplit("/", 1)[0]) if "/" in prefix else self.root
+
+        paths = []
+        for dir_path, _, file_names in os.walk(walk_dir):
+            for file_name in file_names:
+                rel_path = os.path.relpath(os.path.join(dir_path, file_name), self.root)
+                rel_path = rel_path.replace(os.sep, "/")
+                if rel_path.startswith(prefix) and not rel_path.endswith(".tmp"):
+                    paths.append(rel_path)
+        return sorted(paths)
+
+    def read_table(self, path):
+        return pq.read_table(pa.memory_map(self._path(path)))
+
+
+def get_storage(uri, **s3_client_kwargs):
+    """
+    Create the storage backend for the passed URI
+
+    :param uri: "s3://bucket[/prefix]" or "file:///path/to/dir"
+    :param s3_client_kwargs: Passed to the boto3 client for "s3://" URIs
+    """
+    parsed = urlparse(uri)
+
+    if parsed.scheme == "s3":
+        import boto3
+
+        s3_client = boto3.client("s3", **s3_client_kwargs)
+        return S3Storage(s3_client, bucket=parsed.netloc, root=parsed.path)
+
+    if parsed.scheme == "file":
+        return LocalStorage(parsed.netloc + parsed.path)
+
+    raise ValueError(f"Unsupported storage URI: '{uri}'")
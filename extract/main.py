@@ -1,7 +1,7 @@
 import os
 import requests
 
-from common.utils import upload_json_to_s3
+from common.utils import upload_json
 from common.config import TOP_CITIES_TO_TAKE, CITIES_URL, WEATHER_URL, S3_RAW_PREFIX
 
 
@@ -10,13 +10,13 @@ class WeatherFetcher:
     The WeatherFetcher is responsible for:
         1. Getting the top Indian cities data from "simplemaps" API
         2. For each city, fetch weather data for the passed date by calling "OpenWeatherMap" API
-        3. Put this raw data on S3
+        3. Put this raw data on the storage (S3 or local filesystem)
     """
 
-    def __init__(self, logger, date, s3_client):
+    def __init__(self, logger, date, storage):
         self.logger = logger
         self.date = date
-        self.s3_client = s3_client
+        self.storage = storage
 
     def _get_cities(self):
         try:
@@ -71,10 +71,10 @@ class WeatherFetcher:
             # Limit to the top "x" cities
             cities_data = cities_data[:TOP_CITIES_TO_TAKE]
 
-            self.logger.info("[->] Starting upload of raw cities data to S3")
-            # Upload cities data to S3
-            upload_json_to_s3(
-                self.s3_client,
+            self.logger.info("[->] Starting upload of raw cities data to storage")
+            # Upload cities data to the storage
+            upload_json(
+                self.storage,
                 self.logger,
                 cities_data,
                 f"{S3_RAW_PREFIX}/date={self.date}/city_data.json",
@@ -87,12 +87,12 @@ class WeatherFetcher:
                     latitude=city["lat"], longitude=city["lng"]
                 )
                 if weather_data:
-                    # Upload weather data to S3
+                    # Upload weather data to the storage
                     self.logger.info(
-                        f"[->] Starting upload of {city_name} weather to S3"
+                        f"[->] Starting upload of {city_name} weather to storage"
                     )
-                    upload_json_to_s3(
-                        self.s3_client,
+                    upload_json(
+                        self.storage,
                         self.logger,
                         weather_data,
                         f"{S3_RAW_PREFIX}/date={self.date}/weather/{city_name}.json",
@@ -4,21 +4,21 @@ from sqlalchemy.sql import text
 import sqlalchemy as sa
 
 from .models import DimCity, FctWeather
-from common.utils import read_parquet_from_s3
+from common.utils import read_parquet
 from common.config import S3_REFINED_PREFIX
 
 
 class WeatherLoader:
     """
     The WeatherLoader is responsible for:
-        1. Fetching the refined cities data from S3 and inserting the data to Postgres
-        2. Fetching the refined weather data from S3 and inserting the data to Postgres
+        1. Fetching the refined cities data from the storage and inserting the data to Postgres
+        2. Fetching the refined weather data from the storage and inserting the data to Postgres
     """
 
-    def __init__(self, logger, date, s3_client, sqlalchemy_engine):
+    def __init__(self, logger, date, storage, sqlalchemy_engine):
         self.logger = logger
         self.date = date
-        self.s3_client = s3_client
+        self.storage = storage
         self.sqlalchemy_engine = sqlalchemy_engine
 
     def _create_tables_if_not_exists(self):
@@ -67,11 +67,11 @@ class WeatherLoader:
 
     def _load_cities_data(self):
         """
-        Fetch the refined cities data from S3 and insert the data to Postgres
+        Fetch the refined cities data from the storage and insert the data to Postgres
         """
-        # Get the refined cities data from S3
-        cities_df = read_parquet_from_s3(
-            self.s3_client,
+        # Get the refined cities data from the storage
+        cities_df = read_parquet(
+            self.storage,
             self.logger,
             f"{S3_REFINED_PREFIX}/date={self.date}/city_data.parquet",
         )
@@ -101,11 +101,11 @@ class WeatherLoader:
 
     def _load_weather_data(self):
         """
-        Fetch the refined weather data from S3 and insert the data to Postgres
+        Fetch the refined weather data from the storage and insert the data to Postgres
         """
-        # Get the refined cities data from S3
-        weather_df = read_parquet_from_s3(
-            self.s3_client,
+        # Get the refined cities data from the storage
+        weather_df = read_parquet(
+            self.storage,
             self.logger,
             f"{S3_REFINED_PREFIX}/date={self.date}/weather_data.parquet",
         )
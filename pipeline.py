@@ -3,10 +3,10 @@ import sys
 import logging
 import argparse
 from datetime import datetime, timedelta
-import boto3
 from sqlalchemy import create_engine
 
-from common.config import DB_USER, DB_HOST, DB_PORT, DB_NAME
+from common.config import DB_USER, DB_HOST, DB_PORT, DB_NAME, DEFAULT_STORAGE_URI
+from common.storage import get_storage
 from common.utils import valid_date
 from extract.main import WeatherFetcher
 from transform.main import WeatherTransformer
@@ -16,6 +16,7 @@ OPENWEATHERMAP_API_KEY = os.environ.get("OPENWEATHERMAP_API_KEY")
 AWS_ACCESS_KEY = os.environ.get("AWS_ACCESS_KEY")
 AWS_ACCESS_SECRET = os.environ.get("AWS_ACCESS_SECRET")
 PG_PWD = os.environ.get("PG_PWD")
+STORAGE_URI = os.environ.get("STORAGE_URI", DEFAULT_STORAGE_URI)
 
 # Configure logging
 logging.basicConfig(
@@ -31,8 +32,10 @@ class PipelineRunner:
         """
         self.logger = logger
         self.date = date
-        self.s3_client = boto3.client(
-            "s3",
+
+        # Storage backend for the raw and refined layers (S3 or local filesystem)
+        self.storage = get_storage(
+            STORAGE_URI,
             aws_access_key_id=AWS_ACCESS_KEY,
             aws_secret_access_key=AWS_ACCESS_SECRET,
         )
@@ -44,30 +47,30 @@ class PipelineRunner:
 
     def _extract(self):
         """
-        Get the raw weather data and upload to S3
+        Get the raw weather data and upload to the storage
         """
         fetcher = WeatherFetcher(
-            logger=self.logger, date=self.date, s3_client=self.s3_client
+            logger=self.logger, date=self.date, storage=self.storage
         )
         fetcher.fetch_raw_data()
 
     def _transform(self):
         """
-        Read the raw weather data, clean it to create refined data and upload to S3
+        Read the raw weather data, clean it to create refined data and upload to the storage
         """
         transformer = WeatherTransformer(
-            logger=self.logger, date=self.date, s3_client=self.s3_client
+            logger=self.logger, date=self.date, storage=self.storage
         )
         transformer.create_refined_data()
 
     def _load(self):
         """
-        Read the refined data from S3 and load to Postgres database
+        Read the refined data from the storage and load to Postgres database
         """
         loader = WeatherLoader(
             logger=self.logger,
             date=self.date,
-            s3_client=self.s3_client,
+            storage=self.storage,
             sqlalchemy_engine=self.sqlalchemy_engine,
         )
         inserted_data = loader.load()
@@ -119,7 +122,8 @@ if __name__ == "__main__":
 
     # Check if the AWS environment variables are set
     # These are required to put the raw and refined data on S3
-    if AWS_ACCESS_KEY is None or AWS_ACCESS_SECRET is None:
+    is_s3_storage = STORAGE_URI.startswith("s3://")
+    if is_s3_storage and (AWS_ACCESS_KEY is None or AWS_ACCESS_SECRET is None):
         logger.error("[x] AWS credentials not provided.")
         sys.exit()
 
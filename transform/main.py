@@ -2,36 +2,31 @@ import json
 import pandas as pd
 
 from common.config import (
-    S3_BUCKET_NAME,
     S3_RAW_PREFIX,
     S3_REFINED_PREFIX,
     CITIES_DF_COL_LIST,
     WEATHER_DF_COL_LIST,
 )
-from common.utils import write_df_parquet_to_s3
+from common.utils import write_df_parquet
 
 
 class WeatherTransformer:
     """
     The WeatherTransformer is responsible for:
-        1. Cleaning the cities data and uploading the refined cities data to S3
-        2. Cleaning the weather data and uploading the refined weather data to S3
+        1. Cleaning the cities data and uploading the refined cities data to the storage
+        2. Cleaning the weather data and uploading the refined weather data to the storage
     """
 
-    def __init__(self, logger, date, s3_client):
+    def __init__(self, logger, date, storage):
         self.logger = logger
         self.date = date
-        self.s3_client = s3_client
+        self.storage = storage
 
     def _get_raw_cities_data(self):
         """
-        Get the raw cities data from S3
+        Get the raw cities data from the storage
         """
-        obj = self.s3_client.get_object(
-            Bucket=S3_BUCKET_NAME,
-            Key=f"{S3_RAW_PREFIX}/date={self.date}/city_data.json",
-        )
-        data = obj["Body"].read().decode("utf-8")
+        data = self.storage.get(f"{S3_RAW_PREFIX}/date={self.date}/city_data.json")
 
         # Parse JSON data
         json_data = json.loads(data)
@@ -43,7 +38,7 @@ class WeatherTransformer:
 
     def _create_cities_refined_data(self):
         """
-        Clean the raw cities data and upload the refined data to S3 in parquet format
+        Clean the raw cities data and upload the refined data to the storage in parquet format
         """
         # Get the raw cities data
         cities_raw_df = self._get_raw_cities_data()
@@ -58,11 +53,11 @@ class WeatherTransformer:
 
         cities_refined_df.columns = CITIES_DF_COL_LIST
 
-        self.logger.info("[->] Starting upload of refined cities data to S3")
+        self.logger.info("[->] Starting upload of refined cities data to the storage")
 
-        # Upload refined cities data to S3
-        write_df_parquet_to_s3(
-            self.s3_client,
+        # Upload refined cities data to the storage
+        write_df_parquet(
+            self.storage,
             self.logger,
             cities_refined_df,
             f"{S3_REFINED_PREFIX}/date={self.date}/city_data.parquet",
@@ -70,23 +65,17 @@ class WeatherTransformer:
 
     def _get_raw_weather_data(self):
         """
-        Get the raw weather data from S3
+        Get the raw weather data from the storage
         """
         # List objects in the folder
-        response = self.s3_client.list_objects_v2(
-            Bucket=S3_BUCKET_NAME, Prefix=f"{S3_RAW_PREFIX}/date={self.date}/weather/"
-        )
+        file_keys = self.storage.list(f"{S3_RAW_PREFIX}/date={self.date}/weather/")
 
         # Iterate through the objects and read each file
         dfs = []  # List to store DataFrames
-        for obj in response["Contents"]:
-            file_key = obj["Key"]
+        for file_key in file_keys:
             if file_key.endswith(".json"):
-                # Read JSON file from S3
-                file_obj = self.s3_client.get_object(
-                    Bucket=S3_BUCKET_NAME, Key=file_key
-                )
-                data = file_obj["Body"].read().decode("utf-8")
+                # Read JSON file from the storage
+                data = self.storage.get(file_key)
 
                 # Load JSON data into a pandas DataFrame
                 df = pd.json_normalize(json.loads(data))
@@ -102,7 +91,7 @@ class WeatherTransformer:
 
     def _create_weather_refined_data(self):
         """
-        Clean the raw weather data and upload the refined data to S3 in parquet format
+        Clean the raw weather data and upload the refined data to the storage in parquet format
         """
         # Get the raw weather data
         weather_raw_df = self._get_raw_weather_data()
@@ -125,11 +114,11 @@ class WeatherTransformer:
 
         weather_refined_df.columns = WEATHER_DF_COL_LIST
 
-        self.logger.info("[->] Starting upload of refined weather data to S3")
+        self.logger.info("[->] Starting upload of refined weather data to the storage")
 
-        # Upload refined weather data to S3
-        write_df_parquet_to_s3(
-            self.s3_client,
+        # Upload refined weather data to the storage
+        write_df_parquet(
+            self.storage,
             self.logger,
             weather_refined_df,
             f"{S3_REFINED_PREFIX}/date={self.date}/weather_data.parquet",